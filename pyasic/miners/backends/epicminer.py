@@ -13,12 +13,12 @@
 #  See the License for the specific language governing permissions and         -
 #  limitations under the License.                                              -
 # ------------------------------------------------------------------------------
+from __future__ import annotations
+
 import asyncio
 import logging
 from collections import namedtuple
-from typing import List, Optional, Tuple, Union
-
-import toml
+from types import MappingProxyType
 
 from pyasic.API.bosminer import BOSMinerAPI
 from pyasic.config import MinerConfig
@@ -29,75 +29,81 @@ from pyasic.miners.base import BaseMiner
 from pyasic.web.bosminer import BOSMinerWebAPI
 from pyasic.web.epicminer import EPICWebAPI
 
-EPICMINER_DATA_LOC = {
-    "mac": {
-        "cmd": "get_mac",
-        "kwargs": {"web_network": {"web": "network"}},
-    },
-    "model": {"cmd": "get_model", "kwargs": {}},
-    "api_ver": {
-        "cmd": "get_api_ver",
-        "kwargs": {},
-    },
-    "fw_ver": {
-        "cmd": "get_fw_ver",
-        "kwargs": {"web_summary": {"web": "summary"}},
-    },
-    "hostname": {
-        "cmd": "get_hostname",
-        "kwargs": {"web_summary": {"web": "summary"}},
-    },
-    "hashrate": {
-        "cmd": "get_hashrate",
-        "kwargs": {"web_hashrate": {"web": "hashrate"}},
-    },
-    "nominal_hashrate": {
-        "cmd": "get_nominal_hashrate",
-        "kwargs": {},
-    },
-    "hashboards": {
-        "cmd": "get_hashboards",
-        "kwargs": {},
-    },
-    "wattage": {
-        "cmd": "get_wattage",
-        "kwargs": {"web_summary": {"web": "summary"}},
-    },
-    "wattage_limit": {
-        "cmd": "get_wattage_limit",
-        "kwargs": {"web_summary": {"web": "summary"}},
-    },
-    "fans": {
-        "cmd": "get_fans",
-        "kwargs": {"web_summary": {"web": "summary"}},
-    },
-    "fan_psu": {"cmd": "get_fan_psu", "kwargs": {}},
-    "env_temp": {"cmd": "get_env_temp", "kwargs": {"web_summary": {"web": "summary"}}},
-    "temperature_avg": {
-        "cmd": "get_env_temp",
-        "kwargs": {"web_summary": {"web": "summary"}},
-    },
-    "errors": {
-        "cmd": "get_errors",
-        "kwargs": {},
-    },
-    "fault_light": {
-        "cmd": "get_fault_light",
-        "kwargs": {},
-    },
-    "pools": {
-        "cmd": "get_pools",
-        "kwargs": {"web_summary": {"web": "summary"}},
-    },
-    "is_mining": {
-        "cmd": "is_mining",
-        "kwargs": {},
-    },
-    "uptime": {
-        "cmd": "get_uptime",
-        "kwargs": {},
-    },
-}
+# read-only, EPICMiner resolves this into its data plan once per instance
+EPICMINER_DATA_LOC = MappingProxyType(
+    {
+        "mac": {
+            "cmd": "get_mac",
+            "kwargs": {"web_network": {"web": "network"}},
+        },
+        "model": {"cmd": "get_model", "kwargs": {}},
+        "api_ver": {
+            "cmd": "get_api_ver",
+            "kwargs": {},
+        },
+        "fw_ver": {
+            "cmd": "get_fw_ver",
+            "kwargs": {"web_summary": {"web": "summary"}},
+        },
+        "hostname": {
+            "cmd": "get_hostname",
+            "kwargs": {"web_summary": {"web": "summary"}},
+        },
+        "hashrate": {
+            "cmd": "get_hashrate",
+            "kwargs": {"web_hashrate": {"web": "hashrate"}},
+        },
+        "nominal_hashrate": {
+            "cmd": "get_nominal_hashrate",
+            "kwargs": {},
+        },
+        "hashboards": {
+            "cmd": "get_hashboards",
+            "kwargs": {"web_summary": {"web": "summary"}},
+        },
+        "wattage": {
+            "cmd": "get_wattage",
+            "kwargs": {"web_summary": {"web": "summary"}},
+        },
+        "wattage_limit": {
+            "cmd": "get_wattage_limit",
+            "kwargs": {"web_summary": {"web": "summary"}},
+        },
+        "fans": {
+            "cmd": "get_fans",
+            "kwargs": {"web_summary": {"web": "summary"}},
+        },
+        "fan_psu": {"cmd": "get_fan_psu", "kwargs": {}},
+        "env_temp": {
+            "cmd": "get_env_temp",
+            "kwargs": {"web_summary": {"web": "summary"}},
+        },
+        "temperature_avg": {
+            "cmd": "get_env_temp",
+            "kwargs": {"web_summary": {"web": "summary"}},
+        },
+        "errors": {
+            "cmd": "get_errors",
+            "kwargs": {},
+        },
+        "fault_light": {
+            "cmd": "get_fault_light",
+            "kwargs": {},
+        },
+        "pools": {
+            "cmd": "get_pools",
+            "kwargs": {"web_summary": {"web": "summary"}},
+        },
+        "is_mining": {
+            "cmd": "is_mining",
+            "kwargs": {"web_summary": {"web": "summary"}},
+        },
+        "uptime": {
+            "cmd": "get_uptime",
+            "kwargs": {"web_summary": {"web": "summary"}},
+        },
+    }
+)
 
 
 class EPICMiner(BaseMiner):
@@ -118,103 +124,93 @@ class EPICMiner(BaseMiner):
         # data storage
         self.api_ver = api_ver
 
-    async def fault_light_on(self) -> bool:
-        """Turn the fault light of the miner on and return success as a boolean.
+        # resolve the data locations once, so gathering data is a flat loop
+        # of (data name, getter, ((kwarg name, web command), ...))
+        self._data_plan = [
+            (
+                data_name,
+                getattr(self, loc["cmd"]),
+                tuple((arg, src["web"]) for arg, src in loc["kwargs"].items()),
+            )
+            for data_name, loc in self.data_locations.items()
+        ]
+
+    async def _get_data(
+        self, allow_warning: bool, include: list = None, exclude: list = None
+    ) -> dict:
+        plan = self._data_plan
+        if include is not None:
+            plan = [step for step in plan if step[0] in include]
+        if exclude is not None:
+            plan = [step for step in plan if step[0] not in exclude]
+
+        web_commands = {cmd for _, _, kwargs in plan for _, cmd in kwargs}
+        web_data = {}
+        if web_commands:
+            web_data = await self.web.multicommand(
+                *web_commands, allow_warning=allow_warning
+            )
+
+        results = await asyncio.gather(
+            *[
+                function(**{arg: web_data.get(cmd) for arg, cmd in kwargs})
+                for _, function, kwargs in plan
+            ]
+        )
+
+        miner_data = {}
+        for (data_name, _, _), result in zip(plan, results):
+            if not data_name == "pools":
+                miner_data[data_name] = result
+            else:
+                miner_data.update(self._parse_pools_data(result))
+        return miner_data
 
-        Returns:
-            A boolean value of the success of turning the light on.
-        """
+    async def fault_light_on(self) -> bool:
         pass
 
     async def fault_light_off(self) -> bool:
-        """Turn the fault light of the miner off and return success as a boolean.
-
-        Returns:
-            A boolean value of the success of turning the light off.
-        """
         pass
 
-    async def get_uptime(self, *args, **kwargs) -> Optional[int]:
-        """Get the uptime of the miner in seconds.
-
-        Returns:
-            The uptime of the miner in seconds.
-        """
-        data = await self.web.send_command("summary")
-        if data is not None:
-            return data["Session"]["Uptime"]
+    async def get_uptime(self, web_summary: dict = None) -> int | None:
+        if web_summary is None:
+            try:
+                web_summary = await self.web.summary()
+            except APIError:
+                pass
+        if web_summary is not None:
+            try:
+                return web_summary["Session"]["Uptime"]
+            except LookupError:
+                pass
 
     async def get_config(self) -> MinerConfig:
         # Not a data gathering function, since this is used for configuration and not MinerData
-        """Get the mining configuration of the miner and return it as a [`MinerConfig`][pyasic.config.MinerConfig].
-
-        Returns:
-            A [`MinerConfig`][pyasic.config.MinerConfig] containing the pool information and mining configuration.
-        """
         pass
 
     async def reboot(self) -> bool:
-        """Reboot the miner and return success as a boolean.
-
-        Returns:
-            A boolean value of the success of rebooting the miner.
-        """
         pass
 
     async def restart_backend(self) -> bool:
-        """Restart the mining process of the miner (bosminer, bmminer, cgminer, etc) and return success as a boolean.
-
-        Returns:
-            A boolean value of the success of restarting the mining process.
-        """
         pass
 
     async def send_config(self, config: MinerConfig, user_suffix: str = None) -> None:
-        """Set the mining configuration of the miner.
-
-        Parameters:
-            config: A [`MinerConfig`][pyasic.config.MinerConfig] containing the mining config you want to switch the miner to.
-            user_suffix: A suffix to append to the username when sending to the miner.
-        """
         return None
 
     async def stop_mining(self) -> bool:
-        """Stop the mining process of the miner.
-
-        Returns:
-            A boolean value of the success of stopping the mining process.
-        """
         pass
 
     async def resume_mining(self) -> bool:
-        """Resume the mining process of the miner.
-
-        Returns:
-            A boolean value of the success of resuming the mining process.
-        """
         pass
 
     async def set_power_limit(self, wattage: int) -> bool:
-        """Set the power limit to be used by the miner.
-
-        Parameters:
-            wattage: The power limit to set on the miner.
-
-        Returns:
-            A boolean value of the success of setting the power limit.
-        """
         pass
 
     ##################################################
     ### DATA GATHERING FUNCTIONS (get_{some_data}) ###
     ##################################################
 
-    async def get_mac(self, web_network: dict) -> Optional[str]:
-        """Get the MAC address of the miner and return it as a string.
-
-        Returns:
-            A string representing the MAC address of the miner.
-        """
+    async def get_mac(self, web_network: dict = None) -> str | None:
         if web_network is None:
             try:
                 web_network = await self.web.network()
@@ -228,30 +224,15 @@ class EPICMiner(BaseMiner):
                 pass
         return self.fw_ver
 
-    async def get_model(self) -> Optional[str]:
-        """Get the model of the miner and return it as a string.
-
-        Returns:
-            A string representing the model of the miner.
-        """
+    async def get_model(self) -> str | None:
         if self.model is not None:
             return self.model + " (ePIC)"
         return "? (ePIC)"
 
-    async def get_api_ver(self, *args, **kwargs) -> Optional[str]:
-        """Get the API version of the miner and is as a string.
-
-        Returns:
-            API version as a string.
-        """
+    async def get_api_ver(self, *args, **kwargs) -> str | None:
         pass
 
-    async def get_fw_ver(self, web_summary: dict = None) -> Optional[str]:
-        """Get the firmware version of the miner and is as a string.
-
-        Returns:
-            Firmware version as a string.
-        """
+    async def get_fw_ver(self, web_summary: dict = None) -> str | None:
         if web_summary is None:
             try:
                 web_summary = await self.web.summary()
@@ -264,20 +245,10 @@ class EPICMiner(BaseMiner):
                 pass
         return self.fw_ver
 
-    async def get_version(self, *args, **kwargs) -> Tuple[Optional[str], Optional[str]]:
-        """Get the API version and firmware version of the miner and return them as strings.
-
-        Returns:
-            A tuple of (API version, firmware version) as strings.
-        """
+    async def get_version(self, *args, **kwargs) -> tuple[str | None, str | None]:
         pass
 
-    async def get_hostname(self, web_summary: dict = None) -> Optional[str]:
-        """Get the hostname of the miner and return it as a string.
-
-        Returns:
-            A string representing the hostname of the miner.
-        """
+    async def get_hostname(self, web_summary: dict = None) -> str | None:
         if web_summary is None:
             try:
                 web_summary = await self.web.summary()
@@ -290,20 +261,10 @@ class EPICMiner(BaseMiner):
                 pass
         return self.hostname
 
-    async def get_nominal_hashrate(self) -> Optional[float]:
-        """Get the hashrate of the miner and return it as a float in TH/s.
-
-        Returns:
-            Hashrate of the miner in TH/s as a float.
-        """
+    async def get_nominal_hashrate(self) -> float | None:
         return None
 
-    async def get_hashrate(self, web_hashrate: dict) -> Optional[float]:
-        """Get the hashrate of the miner and return it as a float in TH/s.
-
-        Returns:
-            Hashrate of the miner in TH/s as a float.
-        """
+    async def get_hashrate(self, web_hashrate: dict = None) -> float | None:
         if web_hashrate is None:
             try:
                 web_hashrate = await self.web.hashrate()
@@ -312,20 +273,12 @@ class EPICMiner(BaseMiner):
 
         if web_hashrate is not None:
             try:
-                total_hash = 0
-                for d in web_hashrate:
-                    total_hash += d["Total"][0] / 1000000
-                return total_hash
+                return sum(d["Total"][0] for d in web_hashrate) / 1000000
             except LookupError:
                 pass
-        return self.hostname
-
-    async def get_hashboards(self, web_summary: dict = None) -> List[HashBoard]:
-        """Get hashboard data from the miner in the form of [`HashBoard`][pyasic.data.HashBoard].
+        return None
 
-        Returns:
-            A [`HashBoard`][pyasic.data.HashBoard] instance containing hashboard data from the miner.
-        """
+    async def get_hashboards(self, web_summary: dict = None) -> list[HashBoard]:
         hashboards = [
             HashBoard(slot=i, expected_chips=self.nominal_chips)
             for i in range(self.ideal_hashboards)
@@ -339,23 +292,19 @@ class EPICMiner(BaseMiner):
 
         if web_summary is not None:
             try:
-                hb_list = web_summary["HBs"]
                 # might have to check by index?
-                for idx in range(len(hb_list)):
-                    hashboards[idx].hashrate = round(hb_list[idx]["Hashrate"][0] / 1000000, 2)
-                    hashboards[idx].temp = round(hb_list[idx]["Temperature"], 2)
-                    hashboards[idx].chip_temp = round(hb_list[idx]["Temperature"], 2)
-                    hashboards[idx].missing = False
+                # extra boards past ideal_hashboards are ignored
+                for board, hb in zip(hashboards, web_summary["HBs"]):
+                    temp = round(hb["Temperature"], 2)
+                    board.hashrate = round(hb["Hashrate"][0] / 1000000, 2)
+                    board.temp = temp
+                    board.chip_temp = temp
+                    board.missing = False
             except LookupError:
                 pass
         return hashboards
 
-    async def get_env_temp(self, web_summary: dict = None) -> Optional[float]:
-        """Get environment temp from the miner as a float.
-
-        Returns:
-            Environment temp of the miner as a float.
-        """
+    async def get_env_temp(self, web_summary: dict = None) -> float | None:
         if web_summary is None:
             try:
                 web_summary = await self.web.summary()
@@ -363,21 +312,13 @@ class EPICMiner(BaseMiner):
                 pass
         if web_summary is not None:
             try:
-                temp_avg = 0
-                count = 0
-                for i, d in enumerate(web_summary["HBs"]):
-                    temp_avg += d["Temperature"]
-                    count += i
-                return temp_avg / count
+                temps = [d["Temperature"] for d in web_summary["HBs"]]
+                if temps:
+                    return sum(temps) / len(temps)
             except LookupError:
                 pass
 
-    async def get_wattage(self, web_summary: dict = None) -> Optional[int]:
-        """Get wattage from the miner as an int.
-
-        Returns:
-            Wattage of the miner as an int.
-        """
+    async def get_wattage(self, web_summary: dict = None) -> int | None:
         if web_summary is None:
             try:
                 web_summary = await self.web.summary()
@@ -389,12 +330,7 @@ class EPICMiner(BaseMiner):
             except LookupError:
                 pass
 
-    async def get_wattage_limit(self, web_summary: dict = None) -> Optional[int]:
-        """Get wattage limit from the miner as an int.
-
-        Returns:
-            Wattage limit of the miner as an int.
-        """
+    async def get_wattage_limit(self, web_summary: dict = None) -> int | None:
         if web_summary is None:
             try:
                 web_summary = await self.web.summary()
@@ -406,12 +342,7 @@ class EPICMiner(BaseMiner):
             except LookupError:
                 pass
 
-    async def get_fans(self, web_summary: dict = None) -> List[Fan]:
-        """Get fan data from the miner in the form [fan_1, fan_2, fan_3, fan_4].
-
-        Returns:
-            A list of fan data.
-        """
+    async def get_fans(self, web_summary: dict = None) -> list[Fan]:
         if web_summary is None:
             try:
                 web_summary = await self.web.summary()
@@ -420,34 +351,23 @@ class EPICMiner(BaseMiner):
         fans = []
         if web_summary is not None:
             try:
-                for i, d in enumerate(web_summary["Fans Rpm"]):
-                    fan_value = web_summary["Fans Rpm"][f"{d}"]
-                    fans.append(Fan(speed=fan_value))
+                for fan_speed in web_summary["Fans Rpm"].values():
+                    fans.append(Fan(speed=fan_speed))
             except LookupError:
                 pass
         return fans
 
-    async def get_fan_psu(self, *args, **kwargs) -> Optional[int]:
-        """Get PSU fan speed from the miner.
-
-        Returns:
-            PSU fan speed.
-        """
+    async def get_fan_psu(self, *args, **kwargs) -> int | None:
         pass
 
-    async def get_pools(self, web_summary: dict = None) -> List[dict]:
-        """Get pool information from the miner.
-
-        Returns:
-            Pool groups and quotas in a list of dicts.
-        """
+    async def get_pools(self, web_summary: dict = None) -> list[dict]:
         if web_summary is None:
             try:
                 web_summary = await self.web.summary()
             except APIError:
                 pass
+        groups = []
         if web_summary is not None:
-            groups = []
             try:
                 pools = {}
                 pools_config = web_summary["StratumConfigs"]
@@ -459,32 +379,17 @@ class EPICMiner(BaseMiner):
                     )
                     pools[f"pool_{i+1}_user"] = pool["login"]
                 groups.append(pools)
-            except Exception as ex:
-                logging.debug(f"Error getting pools for Epic: {ex}")
+            except (LookupError, TypeError, AttributeError) as e:
+                logging.debug("%s: Error getting pools: %s", self, e)
         return groups
 
-    async def get_errors(self, *args, **kwargs) -> List[MinerErrorData]:
-        """Get a list of the errors the miner is experiencing.
-
-        Returns:
-            A list of error classes representing different errors.
-        """
+    async def get_errors(self, *args, **kwargs) -> list[MinerErrorData]:
         pass
 
     async def get_fault_light(self, *args, **kwargs) -> bool:
-        """Check the status of the fault light and return on or off as a boolean.
-
-        Returns:
-            A boolean value where `True` represents on and `False` represents off.
-        """
         pass
 
-    async def is_mining(self, web_summary: dict = None) -> Optional[bool]:
-        """Check whether the miner is mining.
-
-        Returns:
-            A boolean value representing if the miner is mining.
-        """
+    async def is_mining(self, web_summary: dict = None) -> bool | None:
         if web_summary is None:
             try:
                 web_summary = await self.web.summary()
@@ -495,25 +495,31 @@ class BaseMiner(ABC):
                 miner_data[data_name] = await function(**args_to_send)
             else:
                 pools_data = await function(**args_to_send)
-                if pools_data:
-                    try:
-                        miner_data["pool_1_url"] = pools_data[0]["pool_1_url"]
-                        miner_data["pool_1_user"] = pools_data[0]["pool_1_user"]
-                    except KeyError:
-                        pass
-                    if len(pools_data) > 1:
-                        miner_data["pool_2_url"] = pools_data[1]["pool_1_url"]
-                        miner_data["pool_2_user"] = pools_data[1]["pool_1_user"]
-                        miner_data[
-                            "pool_split"
-                        ] = f"{pools_data[0]['quota']}/{pools_data[1]['quota']}"
-                    else:
-                        try:
-                            miner_data["pool_2_url"] = pools_data[0]["pool_2_url"]
-                            miner_data["pool_2_user"] = pools_data[0]["pool_2_user"]
-                            miner_data["quota"] = "0"
-                        except KeyError:
-                            pass
+                miner_data.update(self._parse_pools_data(pools_data))
+        return miner_data
+
+    @staticmethod
+    def _parse_pools_data(pools_data: List[dict]) -> dict:
+        miner_data = {}
+        if pools_data:
+            try:
+                miner_data["pool_1_url"] = pools_data[0]["pool_1_url"]
+                miner_data["pool_1_user"] = pools_data[0]["pool_1_user"]
+            except KeyError:
+                pass
+            if len(pools_data) > 1:
+                miner_data["pool_2_url"] = pools_data[1]["pool_1_url"]
+                miner_data["pool_2_user"] = pools_data[1]["pool_1_user"]
+                miner_data[
+                    "pool_split"
+                ] = f"{pools_data[0]['quota']}/{pools_data[1]['quota']}"
+            else:
+                try:
+                    miner_data["pool_2_url"] = pools_data[0]["pool_2_url"]
+                    miner_data["pool_2_user"] = pools_data[0]["pool_2_user"]
+                    miner_data["quota"] = "0"
+                except KeyError:
+                    pass
         return miner_data
 
     async def get_data(
@@ -109,12 +109,19 @@ class MinerNetwork:
         miner_factory.clear_cached_miners()
 
         limit = asyncio.Semaphore(PyasicSettings().network_scan_threads)
-        miners = await asyncio.gather(
-            *[self.ping_and_get_miner(host, limit) for host in local_network.hosts()]
+        # a failure on one host should not abort the rest of the scan
+        results = await asyncio.gather(
+            *[self.ping_and_get_miner(host, limit) for host in local_network.hosts()],
+            return_exceptions=True,
         )
 
-        # remove all None from the miner list
-        miners = list(filter(None, miners))
+        # remove all None and failed hosts from the miner list
+        miners = []
+        for result in results:
+            if isinstance(result, BaseException):
+                logging.debug(f"{self} - (Scan Network For Miners) - Error: {result}")
+            elif result is not None:
+                miners.append(result)
         logging.debug(
             f"{self} - (Scan Network For Miners) - Found {len(miners)} miners"
         )
@@ -13,12 +13,21 @@
 #  See the License for the specific language governing permissions and         -
 #  limitations under the License.                                              -
 # ------------------------------------------------------------------------------
+from __future__ import annotations
+
 import asyncio
 import json
-from typing import Union, Any, Literal
+import time
+from typing import Any, Literal
 
 import httpx
 
+try:
+    # optional, noticeably faster on the large summary and hashrate responses
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
 from pyasic.settings import PyasicSettings
 from pyasic.web import BaseWebAPI
 
@@ -27,10 +36,55 @@ class EPICWebAPI(BaseWebAPI):
     def __init__(self, ip: str) -> None:
         super().__init__(ip)
         self.pwd = PyasicSettings().global_epicminer_password
+        self._client = None
+        self._client_loop = None
+        # short lived cache of read-only endpoints, so getters called back
+        # to back share one request instead of each hitting the miner
+        self._cache: dict[str, tuple[float, dict]] = {}
+        self._cache_ttl = 2.0
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # pooled connections are bound to the loop that opened them, so
+        # rebuild the client if we are being used from a new event loop
+        loop = asyncio.get_running_loop()
+        if (
+            self._client is None
+            or self._client.is_closed
+            or self._client_loop is not loop
+        ):
+            self._client = httpx.AsyncClient(
+                base_url=f"http://{self.ip}:4028/",
+                timeout=15,
+                limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=30),
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+
+    async def _send_cached_command(self, command: str) -> dict:
+        cached = self._cache.get(command)
+        if cached is not None and time.monotonic() - cached[0] < self._cache_ttl:
+            return cached[1]
+
+        # if this command is already being fetched, wait on that request
+        inflight = self._inflight.get(command)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self.send_command(command))
+            self._inflight[command] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(command, None))
+        data = await asyncio.shield(inflight)
+
+        if data is not None:
+            self._cache[command] = (time.monotonic(), data)
+        return data
 
     async def send_privileged_command(
         self,
-        command: Union[str, bytes],
+        command: str | bytes,
         ignore_errors: bool = False,
         allow_warning: bool = True,
         **parameters: Any,
@@ -45,40 +99,37 @@ class EPICWebAPI(BaseWebAPI):
 
     async def send_command(
         self,
-        command: Union[str, bytes],
+        command: str | bytes,
         ignore_errors: bool = False,
         allow_warning: bool = True,
         **parameters: Any,
     ) -> dict:
-        url = f"http://{self.ip}:4028/{command}"
+        if parameters:
+            # this is a write, cached reads may now be stale
+            self._cache.clear()
         try:
-            async with httpx.AsyncClient() as client:
-                if parameters:
-                    data = await client.post(
-                        url, data=json.dumps(parameters), timeout=15  # noqa
-                    )
-                else:
-                    data = await client.get(url)
+            if parameters:
+                data = await self._get_client().post(command, json=parameters)
+            else:
+                data = await self._get_client().get(command)
         except httpx.HTTPError:
             pass
         else:
             if data.status_code == 200:
                 try:
-                    return data.json()
+                    return _loads(data.content)
                 except json.decoder.JSONDecodeError:
                     pass
 
     async def multicommand(
         self, *commands: str, ignore_errors: bool = False, allow_warning: bool = True
     ) -> dict:
-        async with httpx.AsyncClient() as client:
-            # shouldn't need to auth, if needed add
-            # await self.auth(client)
-            tasks = [
-                asyncio.create_task(self._handle_multicommand(client, command))
-                for command in commands
-            ]
-            all_data = await asyncio.gather(*tasks)
+        # shouldn't need to auth, if needed add
+        # await self.auth()
+        client = self._get_client()
+        all_data = await asyncio.gather(
+            *[self._handle_multicommand(client, command) for command in commands]
+        )
 
         data = {}
         for item in all_data:
@@ -89,24 +140,23 @@ class EPICWebAPI(BaseWebAPI):
 
     async def _handle_multicommand(self, client: httpx.AsyncClient, command: str):
         try:
-            url = f"http://{self.ip}:4028/{command}"
-            ret = await client.get(url)
+            ret = await client.get(command)
         except httpx.HTTPError:
             pass
         else:
             if ret.status_code == 200:
                 try:
-                    json_data = ret.json()
+                    json_data = _loads(ret.content)
                     return {command: json_data}
                 except json.decoder.JSONDecodeError:
                     pass
         return {command: {}}
 
-    async def auth(self, client: httpx.AsyncClient) -> None:
+    async def auth(self) -> None:
         # assume auth is session based
-        # assume client is already in use
-        url = f"http://{self.ip}:4028/authenticate"
-        await client.post(url, json={"password": self.pwd, "param": None})
+        await self._get_client().post(
+            "authenticate", json={"password": self.pwd, "param": None}
+        )
 
     async def clear_hashrate(self):
         return await self.send_privileged_command("clearhashrate")
@@ -202,7 +252,7 @@ class EPICWebAPI(BaseWebAPI):
         return await self.send_command("clocks")
 
     async def hashrate(self):
-        return await self.send_command("hashrate")
+        return await self._send_cached_command("hashrate")
 
     async def hashrate_history_continuous(self):
         return await self.send_command("hashrate/history/continuous")
@@ -217,16 +267,16 @@ class EPICWebAPI(BaseWebAPI):
         return await self.send_command("log")
 
     async def network(self):
-        return await self.send_command("network")
+        return await self._send_cached_command("network")
 
     async def perpetual_tune(self):
         return await self.send_command("perpetualtune")
 
     async def summary(self):
-        return await self.send_command("summary")
+        return await self._send_cached_command("summary")
 
     async def temps(self):
-        return await self.send_command("temps")
+        return await self._send_cached_command("temps")
 
     async def voltages(self):
-        return await self.send_command("voltages")
\ No newline at end of file
+        return await self._send_cached_command("voltages")
\ No newline at end of file